@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+"""Crypto RSI screener.
+
+Fetches the top coins from the CoinGecko markets endpoint, computes RSI(14)
+on the 7-day sparkline closes (Wilder smoothing, same as the TradingView
+default), and writes a static HTML report plus a machine-readable data.json
+into docs/ for the GitHub Pages site.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+try:
+    from numba import float64, int64, njit
+except ImportError:
+    njit = None
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+RSI_PERIOD = 14
+OVERSOLD_LEVEL = 30
+OVERBOUGHT_LEVEL = 70
+
+COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+COINGECKO_CHART_URL = "https://api.coingecko.com/api/v3/coins/{id}/market_chart"
+CHART_DAYS = 7
+
+# One session for the whole process: keep-alive skips repeated TCP/TLS
+# handshakes, and the mounted retry policy absorbs CoinGecko 429s.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "crypto-rsi-screener/1.0",
+    "Accept-Encoding": "gzip, deflate",
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docs")
+
+RSI_STATE_PATH = os.path.join(DOCS_DIR, "rsi_state.json")
+# CoinGecko sparklines are roughly hourly; state older than one sample
+# interval cannot be advanced by a single Wilder update.
+SPARKLINE_INTERVAL = 3600
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".coingecko_cache.json")
+CACHE_TTL = int(os.environ.get("CG_CACHE_TTL", "300"))
+
+_cache = None
+# Chart fetches run on worker threads; serialize cache mutation and the
+# file write so concurrent puts cannot interleave (same pattern as
+# _rate_gate below).
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    """Return cached API data for `key` if it is younger than CACHE_TTL."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                with open(CACHE_PATH, encoding="utf-8") as f:
+                    _cache = json.load(f)
+            except (OSError, ValueError):
+                _cache = {}
+        entry = _cache.get(key)
+    if entry and time.time() - entry["fetched_at"] < CACHE_TTL:
+        return entry["data"]
+    return None
+
+
+def _cache_put(key, data):
+    """Store API data for `key` and persist the cache to disk."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = {}
+        _cache[key] = {"fetched_at": time.time(), "data": data}
+        try:
+            with open(CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(_cache, f)
+        except OSError:
+            pass
+
+
+def _calculate_rsi_python(prices, period=RSI_PERIOD):
+    """Pure-Python Wilder RSI, used when NumPy is not installed."""
+    if len(prices) < period + 1:
+        return [50.0] * len(prices)
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, period + 1):
+        d = prices[i] - prices[i - 1]
+        gain_sum += max(d, 0.0)
+        loss_sum += max(-d, 0.0)
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
+
+    # Division is far slower than multiplication; fold the two per-step
+    # divides into constant multipliers hoisted out of the loop.
+    alpha = 1.0 / period
+    one_minus_alpha = (period - 1.0) / period
+
+    n = len(prices)
+    rsi_values = [50.0] * n
+    # A zero avg_loss maps to rs = inf and 100/(1+inf) == 0, so rsi = 100
+    # falls out without branching in the hot loop.
+    rs = avg_gain / avg_loss if avg_loss else float("inf")
+    rsi_values[period] = 100.0 - 100.0 / (1.0 + rs)
+
+    for i in range(period + 1, n):
+        d = prices[i] - prices[i - 1]
+        gain = max(d, 0.0)
+        loss = max(-d, 0.0)
+        avg_gain = avg_gain * one_minus_alpha + gain * alpha
+        avg_loss = avg_loss * one_minus_alpha + loss * alpha
+        rs = avg_gain / avg_loss if avg_loss else float("inf")
+        rsi_values[i] = 100.0 - 100.0 / (1.0 + rs)
+
+    return rsi_values
+
+
+def _calculate_rsi_numpy(prices, period=RSI_PERIOD):
+    """Vectorized Wilder RSI on a contiguous float64 array.
+
+    np.diff/np.where run the elementwise arithmetic in C; only the
+    sequential Wilder recurrence itself stays in Python, on unboxed
+    scalars pulled from the gain/loss arrays.
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    n = arr.size
+    if n < period + 1:
+        return np.full(n, 50.0)
+
+    deltas = np.diff(arr)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+
+    m = deltas.size - period
+    gains_tail = gains[period:]
+    losses_tail = losses[period:]
+    if lfilter is not None:
+        # Wilder smoothing is a first-order IIR filter with alpha = 1/period;
+        # lfilter runs the whole recurrence in one compiled call.
+        b = [1.0 / period]
+        a = [1.0, -(period - 1.0) / period]
+        zi_scale = (period - 1.0) / period
+        tail_gains, _ = lfilter(b, a, gains_tail, zi=[avg_gain * zi_scale])
+        tail_losses, _ = lfilter(b, a, losses_tail, zi=[avg_loss * zi_scale])
+        avg_gains = np.concatenate([[avg_gain], tail_gains])
+        avg_losses = np.concatenate([[avg_loss], tail_losses])
+    else:
+        avg_gains = np.empty(m + 1)
+        avg_losses = np.empty(m + 1)
+        avg_gains[0] = avg_gain
+        avg_losses[0] = avg_loss
+        alpha = 1.0 / period
+        one_minus_alpha = (period - 1.0) / period
+        for i in range(m):
+            avg_gain = avg_gain * one_minus_alpha + gains_tail[i] * alpha
+            avg_loss = avg_loss * one_minus_alpha + losses_tail[i] * alpha
+            avg_gains[i + 1] = avg_gain
+            avg_losses[i + 1] = avg_loss
+
+    rs = np.divide(avg_gains, avg_losses,
+                   out=np.full_like(avg_gains, np.inf), where=avg_losses != 0)
+    rsi = 100.0 - 100.0 / (1.0 + rs)
+
+    return np.concatenate([np.full(period, 50.0), rsi])
+
+
+if njit is not None and np is not None:
+    # Eager signature so compilation happens at import, not on first call.
+    @njit(float64[:](float64[:], int64), cache=True, fastmath=True)
+    def _rsi_nb(prices, period):
+        n = prices.shape[0]
+        out = np.full(n, 50.0)
+        if n < period + 1:
+            return out
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, period + 1):
+            d = prices[i] - prices[i - 1]
+            avg_gain += max(d, 0.0)
+            avg_loss += max(-d, 0.0)
+        avg_gain /= period
+        avg_loss /= period
+        alpha = 1.0 / period
+        one_minus_alpha = (period - 1.0) / period
+        rs = avg_gain / avg_loss if avg_loss > 0.0 else np.inf
+        out[period] = 100.0 - 100.0 / (1.0 + rs)
+        for i in range(period + 1, n):
+            d = prices[i] - prices[i - 1]
+            gain = max(d, 0.0)
+            loss = max(-d, 0.0)
+            avg_gain = avg_gain * one_minus_alpha + gain * alpha
+            avg_loss = avg_loss * one_minus_alpha + loss * alpha
+            rs = avg_gain / avg_loss if avg_loss > 0.0 else np.inf
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+        return out
+else:
+    _rsi_nb = None
+
+
+def calculate_rsi(prices, period=RSI_PERIOD):
+    """Wilder RSI series for a list of closes.
+
+    Returns one RSI value per price; the first `period` entries are a
+    neutral 50.0 fill where the indicator is not yet defined.
+    """
+    if talib is not None:
+        arr = np.asarray(prices, dtype=np.float64)
+        # talib.RSI is Wilder-exact; it leaves the first `period` values
+        # NaN, which nan_to_num maps back to the neutral 50.0 fill.
+        return np.nan_to_num(talib.RSI(arr, timeperiod=period), nan=50.0)
+    if _rsi_nb is not None:
+        arr = np.ascontiguousarray(prices, dtype=np.float64)
+        return _rsi_nb(arr, period)
+    if np is not None:
+        return _calculate_rsi_numpy(prices, period)
+    return _calculate_rsi_python(prices, period)
+
+
+def _final_wilder_state(prices, period=RSI_PERIOD):
+    """Wilder (avg_gain, avg_loss) state at the end of a price series."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = prices[i] - prices[i - 1]
+        avg_gain += max(d, 0.0)
+        avg_loss += max(-d, 0.0)
+    avg_gain /= period
+    avg_loss /= period
+    alpha = 1.0 / period
+    one_minus_alpha = (period - 1.0) / period
+    for i in range(period + 1, len(prices)):
+        d = prices[i] - prices[i - 1]
+        gain = max(d, 0.0)
+        loss = max(-d, 0.0)
+        avg_gain = avg_gain * one_minus_alpha + gain * alpha
+        avg_loss = avg_loss * one_minus_alpha + loss * alpha
+    return {"avg_gain": avg_gain, "avg_loss": avg_loss, "last_price": prices[-1]}
+
+
+def calculate_rsi_incremental(state, new_price, period=RSI_PERIOD):
+    """Advance persisted Wilder state by one bar instead of recomputing.
+
+    `state` holds avg_gain/avg_loss/last_price from a previous run; one
+    update per new price replaces the full 168-point sweep. Returns the
+    new RSI and the updated state.
+    """
+    delta = new_price - state["last_price"]
+    gain = max(delta, 0.0)
+    loss = max(-delta, 0.0)
+    alpha = 1.0 / period
+    avg_gain = state["avg_gain"] * (1.0 - alpha) + gain * alpha
+    avg_loss = state["avg_loss"] * (1.0 - alpha) + loss * alpha
+    rs = avg_gain / avg_loss if avg_loss else float("inf")
+    rsi = 100.0 - 100.0 / (1.0 + rs)
+    new_state = {"avg_gain": avg_gain, "avg_loss": avg_loss, "last_price": new_price}
+    return rsi, new_state
+
+
+def _load_rsi_state():
+    try:
+        with open(RSI_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_rsi_state(state_map):
+    os.makedirs(DOCS_DIR, exist_ok=True)
+    try:
+        with open(RSI_STATE_PATH, "w", encoding="utf-8") as f:
+            json.dump(state_map, f)
+    except OSError:
+        pass
+
+
+# CoinGecko's free tier allows roughly 10-30 requests per minute; space
+# calls out client-side so the retry policy never has to eat 429 storms.
+_MIN_REQUEST_INTERVAL = float(os.environ.get("CG_SLEEP_INTERVAL", 60.0 / 25.0))
+_rate_lock = threading.Lock()
+_last_request = [0.0]
+
+
+def _rate_gate():
+    """Block until the next API call fits under the free-tier rate limit."""
+    with _rate_lock:
+        wait = _last_request[0] + _MIN_REQUEST_INTERVAL - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request[0] = time.time()
+
+
+def _fetch_market_chart(coin_id, days=CHART_DAYS):
+    """Fetch hourly closes for one coin from /market_chart, with caching.
+
+    CoinGecko returns hourly granularity automatically for 2-90 day
+    ranges on the free tier (the explicit interval param is paid-only).
+    """
+    key = f"chart:{coin_id}:{days}:hourly"
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    url = COINGECKO_CHART_URL.format(id=coin_id)
+    try:
+        _rate_gate()
+        response = _SESSION.get(url, params={"vs_currency": "usd", "days": days}, timeout=30)
+        response.raise_for_status()
+        prices = [point[1] for point in response.json().get("prices", [])]
+    except requests.RequestException as exc:
+        print(f"Error fetching market chart for {coin_id}: {exc}")
+        return None
+    _cache_put(key, prices)
+    return prices
+
+
+async def _fetch_chart_async(session, semaphore, coin_id, days=CHART_DAYS):
+    """aiohttp counterpart of _fetch_market_chart; shares cache and rate gate."""
+    key = f"chart:{coin_id}:{days}:hourly"
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    url = COINGECKO_CHART_URL.format(id=coin_id)
+    async with semaphore:
+        await asyncio.to_thread(_rate_gate)
+        try:
+            async with session.get(url, params={"vs_currency": "usd", "days": days},
+                                   timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                payload = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            print(f"Error fetching market chart for {coin_id}: {exc}")
+            return None
+    prices = [point[1] for point in payload.get("prices", [])]
+    _cache_put(key, prices)
+    return prices
+
+
+async def _gather_charts(coin_ids, days=CHART_DAYS):
+    """Fetch all charts on one event loop, multiplexed over 8 connections."""
+    semaphore = asyncio.Semaphore(8)
+    connector = aiohttp.TCPConnector(limit=8)
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=dict(_SESSION.headers)) as session:
+        return await asyncio.gather(
+            *(_fetch_chart_async(session, semaphore, coin_id, days) for coin_id in coin_ids))
+
+
+def fetch_crypto_data():
+    """Fetch the top 50 coins by market cap, with 7-day hourly closes.
+
+    The markets call supplies ranks/prices/changes; hourly closes come
+    from per-coin /market_chart calls fetched concurrently, which are
+    gzip-compressed and have deterministic sample spacing (the sparkline
+    field does not document its interval). Charts are attached under the
+    sparkline_in_7d key so downstream consumers are unchanged. Responses
+    are cached on disk for CACHE_TTL seconds so repeated runs inside one
+    window skip the network entirely and stay clear of CoinGecko's
+    free-tier rate limits.
+    """
+    markets = _cache_get("markets")
+    if markets is None:
+        params = {
+            "vs_currency": "usd",
+            "order": "market_cap_desc",
+            "per_page": 50,
+            "page": 1,
+            "sparkline": "false",
+            "price_change_percentage": "24h,7d",
+        }
+        try:
+            _rate_gate()
+            response = _SESSION.get(COINGECKO_MARKETS_URL, params=params, timeout=30)
+            response.raise_for_status()
+            markets = response.json()
+            _cache_put("markets", markets)
+        except requests.RequestException as exc:
+            print(f"Error fetching data from CoinGecko: {exc}")
+            return []
+
+    coin_ids = [coin.get("id") for coin in markets]
+    if aiohttp is not None:
+        charts = asyncio.run(_gather_charts(coin_ids))
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            charts = executor.map(_fetch_market_chart, coin_ids)
+    for coin, prices in zip(markets, charts):
+        coin["sparkline_in_7d"] = {"price": prices or []}
+    return markets
+
+
+def _process_coin(coin, state=None, now=None):
+    """Analyze one market entry; returns (result dict, new state) or (None, None)."""
+    sparkline = (coin.get("sparkline_in_7d") or {}).get("price") or []
+    if np is not None:
+        # One contiguous float64 allocation; skips the boxed Python list
+        # that calculate_rsi would immediately convert anyway.
+        prices = np.fromiter((p for p in sparkline if p is not None), dtype=np.float64)
+    else:
+        prices = [float(p) for p in sparkline if p is not None]
+    if len(prices) < RSI_PERIOD + 1:
+        return None, None
+
+    now = now if now is not None else time.time()
+    if state is not None and now - state.get("last_timestamp", 0) < SPARKLINE_INTERVAL:
+        # float() unboxes the np.float64 from the fromiter array so the
+        # result (and persisted state) stay plain-JSON serializable.
+        current_rsi, new_state = calculate_rsi_incremental(state, float(prices[-1]))
+    else:
+        rsi_values = calculate_rsi(prices)
+        current_rsi = float(rsi_values[-1])
+        new_state = _final_wilder_state(prices)
+    new_state["last_timestamp"] = now
+
+    result = {
+        "market_cap_rank": coin.get("market_cap_rank"),
+        "symbol": (coin.get("symbol") or "").upper(),
+        "name": coin.get("name"),
+        "current_price": coin.get("current_price"),
+        "market_cap": coin.get("market_cap"),
+        "price_change_24h": coin.get("price_change_percentage_24h_in_currency"),
+        "price_change_7d": coin.get("price_change_percentage_7d_in_currency"),
+        "rsi": round(current_rsi, 2),
+    }
+    return result, new_state
+
+
+def analyze_crypto_rsi(crypto_data):
+    """Compute the latest RSI for every coin and categorize it.
+
+    Returns (results, stats) where stats counts results per category, so
+    consumers do not re-scan the result list."""
+    state_map = _load_rsi_state()
+    now = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        processed = list(executor.map(
+            lambda c: _process_coin(c, state_map.get(c.get("id")), now),
+            crypto_data,
+        ))
+
+    # State is keyed by CoinGecko id: ticker symbols are not unique
+    # across coins, and a collision would feed one coin's averages into
+    # another's incremental update.
+    results = []
+    new_state_map = {}
+    for coin, (result, new_state) in zip(crypto_data, processed):
+        if result is None:
+            continue
+        results.append(result)
+        new_state_map[coin.get("id")] = new_state
+    _save_rsi_state(new_state_map)
+
+    # Categorize and sort column-wise: one np.select over the RSI array
+    # and one argsort replace 50 Python if/elif branches and a key-func
+    # sort; the row dicts are only reordered at the end.
+    if np is not None and results:
+        rsi_arr = np.fromiter((r["rsi"] for r in results), dtype=np.float64, count=len(results))
+        categories = np.select(
+            [rsi_arr <= OVERSOLD_LEVEL, rsi_arr >= OVERBOUGHT_LEVEL],
+            ["Oversold", "Overbought"], default="Neutral")
+        for result, category in zip(results, categories):
+            result["category"] = str(category)
+        results = [results[i] for i in np.argsort(rsi_arr, kind="stable")]
+    else:
+        for result in results:
+            if result["rsi"] <= OVERSOLD_LEVEL:
+                result["category"] = "Oversold"
+            elif result["rsi"] >= OVERBOUGHT_LEVEL:
+                result["category"] = "Overbought"
+            else:
+                result["category"] = "Neutral"
+        results.sort(key=lambda r: r["rsi"])
+
+    stats = collections.Counter(r["category"] for r in results)
+    return results, stats
+
+
+# Parsed once at import; the per-row cost inside generate_html_report is
+# a single format_map call.
+_ROW_TMPL = """        <tr>
+          <td class="mono">#{market_cap_rank}</td>
+          <td><strong>{symbol}</strong></td>
+          <td>{name}</td>
+          <td class="mono">{price_fmt}</td>
+          <td class="mono {p24_color}">{p24_fmt}</td>
+          <td class="mono {p7_color}">{p7_fmt}</td>
+          <td class="mono {rsi_class}">{rsi:.2f}</td>
+          <td><span class="badge badge-{rsi_class}">{category}</span></td>
+        </tr>
+"""
+
+
+def generate_html_report(results, stats=None):
+    """Write docs/report.html and docs/data.json from the analysis results."""
+    if stats is None:
+        stats = collections.Counter(r["category"] for r in results)
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+    header = f"""<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <title>Crypto RSI(14) Screener</title>
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <style>
+    :root {{ --bg: #0f1115; --panel: #151924; --text: #e6e6e6; --muted: #a0a7b4;
+             --good: #2bb673; --bad: #e5534b; --warn: #ffbf3f; }}
+    body {{ background: var(--bg); color: var(--text); font-family: system-ui, sans-serif; margin: 0; padding: 24px; }}
+    h1 {{ margin: 0 0 8px; font-size: 20px; }}
+    .sub {{ color: var(--muted); margin-bottom: 16px; font-size: 13px; }}
+    .panel {{ background: var(--panel); border-radius: 10px; padding: 16px; }}
+    table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
+    th {{ text-align: left; color: var(--muted); border-bottom: 1px solid #2a2f3a; padding: 8px; }}
+    td {{ border-bottom: 1px solid #202533; padding: 8px; white-space: nowrap; }}
+    .mono {{ font-variant-numeric: tabular-nums; font-family: ui-monospace, monospace; }}
+    .oversold {{ color: var(--good); }} .overbought {{ color: var(--bad); }} .neutral {{ color: var(--warn); }}
+    .badge {{ padding: 2px 8px; border-radius: 999px; font-size: 11px; color: #061018; }}
+    .badge-oversold {{ background: var(--good); }}
+    .badge-overbought {{ background: var(--bad); }}
+    .badge-neutral {{ background: var(--warn); }}
+    .green {{ color: var(--good); }} .red {{ color: var(--bad); }}
+  </style>
+</head>
+<body>
+  <h1>Crypto RSI(14) Screener</h1>
+  <div class="sub">
+    Top 50 coins by market cap &middot; RSI(14, Wilder) on 7-day hourly closes &middot;
+    Oversold &le; {OVERSOLD_LEVEL}, Overbought &ge; {OVERBOUGHT_LEVEL} &middot; Generated {generated_at}
+  </div>
+  <div class="sub">
+    Oversold: {stats['Oversold']} &middot; Neutral: {stats['Neutral']} &middot; Overbought: {stats['Overbought']}
+  </div>
+  <div class="panel">
+    <table>
+      <thead>
+        <tr>
+          <th>#</th><th>Symbol</th><th>Name</th><th>Price</th>
+          <th>24h</th><th>7d</th><th>RSI(14)</th><th>Signal</th>
+        </tr>
+      </thead>
+      <tbody>
+"""
+
+    footer = """      </tbody>
+    </table>
+  </div>
+</body>
+</html>
+"""
+
+    parts = [header]
+    for coin in results:
+        price = coin["current_price"]
+        p24 = coin["price_change_24h"]
+        p7 = coin["price_change_7d"]
+        row_data = {
+            **coin,
+            "rsi_class": coin["category"].lower(),
+            "price_fmt": f"${price:,.4f}" if price is not None else "-",
+            "p24_color": "green" if (p24 or 0) >= 0 else "red",
+            "p7_color": "green" if (p7 or 0) >= 0 else "red",
+            "p24_fmt": f"{p24:+.2f}%" if p24 is not None else "-",
+            "p7_fmt": f"{p7:+.2f}%" if p7 is not None else "-",
+        }
+        parts.append(_ROW_TMPL.format_map(row_data))
+    parts.append(footer)
+
+    os.makedirs(DOCS_DIR, exist_ok=True)
+    report_path = os.path.join(DOCS_DIR, "report.html")
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+
+    payload = {
+        "generated_at": int(time.time()),
+        "rsi_period": RSI_PERIOD,
+        "oversold": stats["Oversold"],
+        "neutral": stats["Neutral"],
+        "overbought": stats["Overbought"],
+        "results": results,
+    }
+    data_path = os.path.join(DOCS_DIR, "data.json")
+    if orjson is not None:
+        with open(data_path, "wb") as f:
+            # OPT_SERIALIZE_NUMPY keeps the fast path as permissive as the
+            # json.dump fallback, which accepts float subclasses.
+            f.write(orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(data_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    return report_path
+
+
+def main():
+    print("Fetching market data from CoinGecko...")
+    crypto_data = fetch_crypto_data()
+    if not crypto_data:
+        print("No data received, aborting.")
+        return 1
+
+    print(f"Analyzing RSI for {len(crypto_data)} coins...")
+    results, stats = analyze_crypto_rsi(crypto_data)
+
+    print(f"Oversold: {stats['Oversold']}  Neutral: {stats['Neutral']}  Overbought: {stats['Overbought']}")
+
+    # results is already sorted by RSI ascending, so the extremes sit at
+    # either end; no per-category filter-and-sort needed.
+    for coin in results[:3]:
+        if coin["category"] == "Oversold":
+            print(f"  Most oversold: {coin['symbol']} RSI={coin['rsi']:.2f}")
+    for coin in results[:-4:-1]:
+        if coin["category"] == "Overbought":
+            print(f"  Most overbought: {coin['symbol']} RSI={coin['rsi']:.2f}")
+
+    report_path = generate_html_report(results, stats)
+    print(f"Report written to {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())